@@ -95,6 +95,10 @@ class Settings(BaseSettings):
 
     # Features
     enable_open_badges: bool = False
+    static_lookup_cache: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("WITNESS_STATIC_CACHE"),
+    )
 
     # Data Store (DynamoDB)
     use_data_store: bool = False
@@ -482,7 +482,13 @@ if allowed_origins:
         allow_headers=["Accept", "Content-Type", "Authorization"],
     )
 # Static files
-app.mount("/static", CachedStaticFiles(directory="fitness/static"), name="static")
+app.mount(
+    "/static",
+    CachedStaticFiles(
+        directory="fitness/static", memoize_lookups=settings.static_lookup_cache
+    ),
+    name="static",
+)
 # Optional tracing
 if settings.enable_tracing and settings.otlp_endpoint:
     configure_tracing(
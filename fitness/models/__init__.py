@@ -0,0 +1,8 @@
+"""ORM models.
+
+Importing this package registers every table on ``Base.metadata``.
+"""
+
+from fitness.models import blog, certification, user  # noqa: F401
+
+__all__ = ["blog", "certification", "user"]
@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import case, desc, func, or_
+from sqlalchemy import case, desc, func, or_, update
 from sqlalchemy.orm import Session
 
 from fitness.auth import current_active_user
@@ -106,8 +106,12 @@ async def log_entry(
     if not entry:
         raise HTTPException(status_code=404, detail="Log entry not found")
 
-    # Increment view count
-    entry.view_count += 1
+    # Increment view count in a single UPDATE so concurrent views don't race
+    db.execute(
+        update(BlogEntry)
+        .where(BlogEntry.id == entry.id)
+        .values(view_count=BlogEntry.view_count + 1)
+    )
     db.commit()
 
     # Convert to public schema
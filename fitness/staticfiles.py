@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 
 from fastapi.staticfiles import StaticFiles
@@ -14,9 +17,41 @@ templates.env.globals["asset_url"] = asset_url
 
 
 class CachedStaticFiles(StaticFiles):
-    def __init__(self, *args, cache_control: str | None = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        cache_control: str | None = None,
+        memoize_lookups: bool = False,
+        lookup_cache_size: int = 512,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.cache_control = cache_control or "public, max-age=31536000, immutable"
+        # Static assets are immutable for the lifetime of the process, so the
+        # stat() behind each hit can be remembered per request path. Only hits
+        # are kept, in a bounded LRU, so unique 404 paths cannot grow it and a
+        # file added after a miss is still found. Starlette calls lookup_path
+        # from worker threads, so the LRU is only touched under the lock.
+        self.memoize_lookups = memoize_lookups
+        self.lookup_cache_size = lookup_cache_size
+        self._lookups: OrderedDict[str, tuple[str, os.stat_result]] = OrderedDict()
+        self._lookups_lock = threading.Lock()
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        if not self.memoize_lookups:
+            return super().lookup_path(path)
+        with self._lookups_lock:
+            cached = self._lookups.get(path)
+            if cached is not None:
+                self._lookups.move_to_end(path)
+                return cached
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            with self._lookups_lock:
+                self._lookups[path] = (full_path, stat_result)
+                if len(self._lookups) > self.lookup_cache_size:
+                    self._lookups.popitem(last=False)
+        return full_path, stat_result
 
     async def get_response(self, path: str, scope):
         response = await super().get_response(path, scope)
@@ -3,53 +3,125 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 
 TESTS_ROOT = Path(__file__).parent
 
 # Set DATABASE_URL *before* importing fitness modules so the app doesn't try to
 # open the default production database path (which may not exist in test envs).
+# Under pytest-xdist each worker gets its own file so startup DDL and cleanup
+# in one worker never race another.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+_DB_SUFFIX = f"-{_XDIST_WORKER}" if _XDIST_WORKER else ""
 os.environ.setdefault("DATABASE_URL", "sqlite:///test_app.db")
+if _DB_SUFFIX and os.environ["DATABASE_URL"].endswith(".db"):
+    os.environ["DATABASE_URL"] = os.environ["DATABASE_URL"][:-3] + f"{_DB_SUFFIX}.db"
+# Opt the test app into static lookup memoization so /static requests go
+# through the locked LRU in CachedStaticFiles, not just its unit tests.
+os.environ.setdefault("WITNESS_STATIC_CACHE", "1")
 
+import httpx  # noqa: E402
 import pytest  # noqa: E402
-from fastapi.testclient import TestClient  # noqa: E402
-from sqlalchemy import create_engine  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.engine import Connection, Engine  # noqa: E402
 from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
 
-import fitness.main as main_module  # noqa: E402
 from fitness.database import Base  # noqa: E402
 from fitness.database import get_db as db_dependency  # noqa: E402
-from fitness.main import app  # noqa: E402
-from fitness.models import (  # noqa: E402,F401 - ensure metadata is populated
-    blog,
-    certification,
-)
 from fitness.security.rate_limit import limiter  # noqa: E402
 
 # Disable rate limiting in tests to prevent cross-test 429 flakes
 limiter.enabled = False
 
-TEST_DB_PATH = Path("test_app.db")
+# Created by the app's own engines (DATABASE_URL above) during startup; the
+# fixtures themselves use an in-memory database.
+TEST_DB_PATH = Path(f"test_app{_DB_SUFFIX}.db")
 TESTING_SESSION_FACTORY: sessionmaker | None = None
+# Connection holding the per-test outer transaction opened by ``db_session``.
+# While set, request sessions join it so handlers see the test's rows.
+TEST_CONNECTION: Connection | None = None
+
+
+def _enable_sqlite_savepoints(engine: Engine) -> None:
+    """Let SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs work."""
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _new_session(**kwargs):
+    if TEST_CONNECTION is not None:
+        return TESTING_SESSION_FACTORY(
+            bind=TEST_CONNECTION, join_transaction_mode="create_savepoint", **kwargs
+        )
+    return TESTING_SESSION_FACTORY(**kwargs)
 
 
 @pytest.fixture(scope="session")
-def client():
+def db_engine():
+    """Create the in-memory test engine and schema once per session."""
     global TESTING_SESSION_FACTORY
-    if TEST_DB_PATH.exists():
-        TEST_DB_PATH.unlink()
+    # Deferred until a DB test actually runs so ``--collect-only`` and narrow
+    # ``-k`` selections skip the model import graph.
+    import fitness.models  # noqa: F401 - populates Base.metadata
 
+    # StaticPool hands every session the same connection, so the in-memory
+    # database is shared across sessions and the TestClient thread.
     engine = create_engine(
-        f"sqlite:///{TEST_DB_PATH}",
+        "sqlite://",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
+    _enable_sqlite_savepoints(engine)
+    Base.metadata.create_all(bind=engine)
     TESTING_SESSION_FACTORY = sessionmaker(
         bind=engine, autocommit=False, autoflush=False
     )
-    Base.metadata.create_all(bind=engine)
+    yield engine
+    TESTING_SESSION_FACTORY = None
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported on first use rather than at collection.
+
+    Test modules should take this fixture instead of importing
+    ``fitness.main`` at module scope, so ``--collect-only`` and ``-k`` runs
+    never build the application.
+    """
+    from fitness.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(db_engine):
+    """Session-wide TestClient for the real app.
+
+    Tests should take this fixture instead of building ``TestClient(app)``
+    themselves, so the lifespan (DB seeding, admin bootstrap) runs once.
+    """
+    # Imported here so collection (e.g. ``pytest -k`` or ``--collect-only``)
+    # does not pay for building the full application.
+    from fastapi.testclient import TestClient
+
+    import fitness.main as main_module
+    from fitness.main import app
+
+    if TEST_DB_PATH.exists():
+        TEST_DB_PATH.unlink()
 
     def override_get_db():
-        db = TESTING_SESSION_FACTORY()
+        db = _new_session()
         try:
             yield db
         finally:
@@ -59,25 +131,118 @@ def client():
     main_module.get_db = override_get_db
 
     with TestClient(app) as test_client:
+        # Warm template loading, routing and the first DB connection once
+        # instead of on whichever test happens to hit them first.
+        for path in ("/healthz", "/", "/certs", "/contact", "/resume"):
+            test_client.get(path)
+        # Drop rows seeded during startup once, so each ``db_session`` test
+        # starts from the same empty baseline and only needs a rollback.
+        with db_engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
         yield test_client
 
     app.dependency_overrides.pop(db_dependency, None)
-    if TESTING_SESSION_FACTORY:
-        TESTING_SESSION_FACTORY.close_all()
     if TEST_DB_PATH.exists():
         TEST_DB_PATH.unlink()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(app, client) -> AsyncIterator[httpx.AsyncClient]:
+    """Session-wide ``AsyncClient`` over the same app as ``client``.
+
+    It is opened and closed on the session event loop that every async test
+    runs on (see ``asyncio_default_test_loop_scope`` in pyproject.toml).
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def csrf_token(client) -> str:
+    """A CSRF token issued by ``GET /contact``, fetched once per session.
+
+    Validation is double-submit (cookie must equal the form field), so the
+    same value stays valid for every post. The cookie jar is cleared between
+    tests; send it with ``client.cookies.set("wtf_csrf", csrf_token)``.
+    """
+    client.get("/contact")
+    token = client.cookies.get("wtf_csrf")
+    assert isinstance(token, str), "Expected CSRF cookie after GET /contact"
+    return token
+
+
+@pytest.fixture(scope="session")
+def raise_route(app, client) -> Iterator[str]:
+    """Register ``GET /_raise/{code}`` once and yield its prefix.
+
+    The route raises ``HTTPException(code, detail)`` so error-page tests can
+    share one handler instead of each adding its own route to the app.
+    """
+    from fastapi import APIRouter, HTTPException
+
+    router = APIRouter()
+
+    @router.get("/_raise/{code}")
+    async def _raise(code: int, detail: str = "test"):
+        raise HTTPException(status_code=code, detail=detail)
+
+    app.include_router(router)
+    yield "/_raise"
+    app.router.routes[:] = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", None) != "/_raise/{code}"
+    ]
+
+
+# Markup every LCARS error page (401, 404, 503) shares.
+LCARS_BASE_TOKENS = (b"error-code", b"error-message", b"lcars-divider", b"--lcars-")
+
+
+@pytest.fixture(scope="session")
+def lcars_base_tokens() -> tuple[bytes, ...]:
+    """Byte fragments common to all LCARS-styled error pages."""
+    return LCARS_BASE_TOKENS
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_cookies(request: pytest.FixtureRequest) -> None:
+    """Start every test that uses the shared client with an empty cookie jar.
+
+    Tests that never ask for ``client`` are left alone so pure unit tests
+    don't pay for starting the app.
+    """
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def app_routes(app) -> frozenset[str]:
+    """Paths registered on the app, collected once per session."""
+    return frozenset(route.path for route in app.routes)
+
+
 @pytest.fixture
-def db_session(client):
-    if TESTING_SESSION_FACTORY is None:
-        raise RuntimeError("Session factory not initialized")
-    session = TESTING_SESSION_FACTORY()
+def db_session(client, db_engine):
+    """Yield a session whose writes are rolled back after the test.
+
+    The test runs inside one outer transaction; ``commit()`` calls from the
+    test or from request handlers only release SAVEPOINTs, so teardown is a
+    single ROLLBACK instead of a DELETE per table. Requests share the test's
+    connection, so a ``flush()`` is enough for handlers to see seeded rows.
+    """
+    global TEST_CONNECTION
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    TEST_CONNECTION = connection
+    session = _new_session()
     try:
         yield session
     finally:
-        # Ensure database state is isolated between tests
-        for table in reversed(Base.metadata.sorted_tables):
-            session.execute(table.delete())
-        session.commit()
         session.close()
+        TEST_CONNECTION = None
+        transaction.rollback()
+        connection.close()
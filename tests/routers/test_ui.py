@@ -14,7 +14,8 @@ def test_home_endpoint_returns_html_for_browser_request(client: TestClient):
     response = client.get("/", headers={"Accept": "text/html"})
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
-    assert "Witness the Fitness" in response.text or "Captain" in response.text
+    body = response.content
+    assert b"Witness the Fitness" in body or b"Captain" in body
 
 
 def test_home_endpoint_returns_json_for_api_request(client: TestClient):
@@ -29,25 +30,25 @@ def test_home_endpoint_returns_json_for_api_request(client: TestClient):
 def test_home_endpoint_includes_cert_count(client: TestClient, db_session: Session):
     """Test home endpoint includes certification count."""
     # Add test certifications
-    db_session.add(
-        Certification(
-            slug="test-cert-1",
-            title="Test Cert 1",
-            issuer="Test Issuer",
-            sha256="abc123",
-            pdf_url="http://example.com/cert.pdf",
-        )
+    db_session.add_all(
+        [
+            Certification(
+                slug="test-cert-1",
+                title="Test Cert 1",
+                issuer="Test Issuer",
+                sha256="abc123",
+                pdf_url="http://example.com/cert.pdf",
+            ),
+            Certification(
+                slug="test-cert-2",
+                title="Test Cert 2",
+                issuer="Test Issuer",
+                sha256="def456",
+                pdf_url="http://example.com/cert2.pdf",
+            ),
+        ]
     )
-    db_session.add(
-        Certification(
-            slug="test-cert-2",
-            title="Test Cert 2",
-            issuer="Test Issuer",
-            sha256="def456",
-            pdf_url="http://example.com/cert2.pdf",
-        )
-    )
-    db_session.commit()
+    db_session.flush()
 
     response = client.get("/", headers={"Accept": "application/json"})
     assert response.status_code == 200
@@ -65,32 +66,32 @@ def test_certs_endpoint_returns_html(client: TestClient):
 def test_certs_endpoint_deduplicates_by_sha256(client: TestClient, db_session: Session):
     """Test /certs page deduplicates certifications with same SHA256."""
     # Add duplicate certs with same SHA256
-    db_session.add(
-        Certification(
-            slug="dup-cert-old",
-            title="Duplicate Cert Old",
-            issuer="Test Issuer",
-            sha256="duplicate_hash",
-            pdf_url="http://example.com/old.pdf",
-        )
+    db_session.add_all(
+        [
+            Certification(
+                slug="dup-cert-old",
+                title="Duplicate Cert Old",
+                issuer="Test Issuer",
+                sha256="duplicate_hash",
+                pdf_url="http://example.com/old.pdf",
+            ),
+            Certification(
+                slug="dup-cert-new",
+                title="Duplicate Cert New",
+                issuer="Test Issuer",
+                sha256="duplicate_hash",
+                pdf_url="http://example.com/new.pdf",
+            ),
+        ]
     )
-    db_session.add(
-        Certification(
-            slug="dup-cert-new",
-            title="Duplicate Cert New",
-            issuer="Test Issuer",
-            sha256="duplicate_hash",
-            pdf_url="http://example.com/new.pdf",
-        )
-    )
-    db_session.commit()
+    db_session.flush()
 
     response = client.get("/certs")
     assert response.status_code == 200
 
     # Should only show the newer cert (last one added)
-    assert "Duplicate Cert New" in response.text
-    assert "dup-cert-new" in response.text
+    assert b"Duplicate Cert New" in response.content
+    assert b"dup-cert-new" in response.content
 
 
 def test_certs_endpoint_hides_invisible_certs(client: TestClient, db_session: Session):
@@ -105,11 +106,11 @@ def test_certs_endpoint_hides_invisible_certs(client: TestClient, db_session: Se
             is_visible=False,
         )
     )
-    db_session.commit()
+    db_session.flush()
 
     response = client.get("/certs")
     assert response.status_code == 200
-    assert "hidden-cert-test" not in response.text.lower()
+    assert b"hidden-cert-test" not in response.content.lower()
 
 
 def test_certs_endpoint_separates_active_and_inactive(
@@ -129,7 +130,7 @@ def test_certs_endpoint_separates_active_and_inactive(
 
     # Add inactive cert (would need to be in INACTIVE_CERT_SLUGS in constants.py)
     # For now, just verify the endpoint works
-    db_session.commit()
+    db_session.flush()
 
     response = client.get("/certs")
     assert response.status_code == 200
@@ -144,6 +145,7 @@ def test_certs_endpoint_separates_active_and_inactive(
         ("/resume", 200),
         ("/nonexistent-route-12345", 404),
     ],
+    ids=["home", "certs", "contact", "resume", "missing"],
 )
 def test_ui_routes_return_expected_status_codes(
     client: TestClient, path: str, expected_status: int
@@ -163,7 +165,7 @@ def test_contact_page_includes_csrf_token(client: TestClient):
     assert csrf_cookie is not None
 
     # Check for CSRF token in HTML (hidden field or meta tag)
-    assert "csrf" in response.text.lower()
+    assert b"csrf" in response.content.lower()
 
 
 def test_resume_page_loads(client: TestClient):
@@ -195,16 +197,12 @@ def test_home_page_template_variables(client: TestClient):
     assert response.status_code == 200
 
     # Check for common template elements
-    html = response.text
-    assert "html" in html.lower()
+    assert b"html" in response.content.lower()
 
 
 def test_certs_page_with_no_certs(client: TestClient, db_session: Session):
     """Test /certs page handles empty certification list."""
-    # Clear all certs
-    db_session.query(Certification).delete()
-    db_session.commit()
-
+    # db_session starts from an empty, rolled-back baseline
     response = client.get("/certs")
     assert response.status_code == 200
     # Should still render without errors
@@ -212,16 +210,15 @@ def test_certs_page_with_no_certs(client: TestClient, db_session: Session):
 
 def test_multiple_requests_maintain_session(client: TestClient):
     """Test multiple requests to the same client maintain session."""
-    # First request
+    # First request sets the CSRF cookie
     response1 = client.get("/contact")
-    csrf_token1 = client.cookies.get("wtf_csrf")
+    assert response1.status_code == 200
+    assert client.cookies.get("wtf_csrf") is not None
 
-    # Second request
+    # Second request keeps the session's cookie (value may or may not change)
     response2 = client.get("/contact")
-    csrf_token2 = client.cookies.get("wtf_csrf")
-
-    assert response1.status_code == 200
     assert response2.status_code == 200
-    # CSRF tokens should be present (may or may not be the same)
-    assert csrf_token1 is not None
-    assert csrf_token2 is not None
+    cookie = next(cookie for cookie in client.cookies.jar if cookie.name == "wtf_csrf")
+    assert cookie.path == "/"
+    assert cookie.get_nonstandard_attr("SameSite") == "strict"
+    assert cookie.has_nonstandard_attr("HttpOnly")
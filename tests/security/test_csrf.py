@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import NonCallableMagicMock, create_autospec
 
 import pytest
 from fastapi import HTTPException, Request, Response
@@ -10,19 +11,30 @@ from fastapi import HTTPException, Request, Response
 from fitness.security import csrf
 
 
+@pytest.fixture(scope="module")
+def _request_proto() -> NonCallableMagicMock:
+    """Autospec ``Request`` once; introspecting the spec is the costly part."""
+    return create_autospec(Request, instance=True)
+
+
+@pytest.fixture
+def mock_request(_request_proto: NonCallableMagicMock) -> NonCallableMagicMock:
+    """Reset the shared ``Request`` mock to empty cookies, headers and state."""
+    _request_proto.reset_mock()
+    _request_proto.cookies = {}
+    _request_proto.headers = {}
+    _request_proto.state = SimpleNamespace(csrf_token=None)
+    return _request_proto
+
+
 def test_csrf_cookie_name_constant():
     """Test CSRF cookie name is defined."""
     assert csrf.CSRF_COOKIE_NAME == "wtf_csrf"
     assert csrf.CSRF_HEADER_NAME == "X-CSRF-Token"
 
 
-def test_issue_csrf_token_generates_new_token():
+def test_issue_csrf_token_generates_new_token(mock_request):
     """Test CSRF token generation for new requests."""
-    mock_request = MagicMock(spec=Request)
-    mock_request.state = MagicMock()
-    mock_request.state.csrf_token = None
-    mock_request.cookies = {}
-
     token = csrf.issue_csrf_token(mock_request)
 
     assert isinstance(token, str)
@@ -30,25 +42,19 @@ def test_issue_csrf_token_generates_new_token():
     assert mock_request.state.csrf_token == token
 
 
-def test_issue_csrf_token_reuses_existing_state_token():
+def test_issue_csrf_token_reuses_existing_state_token(mock_request):
     """Test CSRF token reuse when already in request state."""
     existing_token = "existing_csrf_token_12345"
-    mock_request = MagicMock(spec=Request)
-    mock_request.state = MagicMock()
     mock_request.state.csrf_token = existing_token
-    mock_request.cookies = {}
 
     token = csrf.issue_csrf_token(mock_request)
 
     assert token == existing_token
 
 
-def test_issue_csrf_token_reuses_cookie_token():
+def test_issue_csrf_token_reuses_cookie_token(mock_request):
     """Test CSRF token reuse from cookie when no state token."""
     cookie_token = "cookie_csrf_token_67890"
-    mock_request = MagicMock(spec=Request)
-    mock_request.state = MagicMock()
-    mock_request.state.csrf_token = None
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: cookie_token}
 
     token = csrf.issue_csrf_token(mock_request)
@@ -84,9 +90,8 @@ def test_set_csrf_cookie_not_secure_in_debug_mode(monkeypatch):
     assert "Secure" not in cookie_header  # Not secure in debug mode
 
 
-def test_verify_csrf_header_returns_header_value():
+def test_verify_csrf_header_returns_header_value(mock_request):
     """Test CSRF header extraction from request."""
-    mock_request = MagicMock(spec=Request)
     mock_request.headers = {"X-CSRF-Token": "header_token_value"}
 
     token = csrf.verify_csrf_header(mock_request)
@@ -94,21 +99,16 @@ def test_verify_csrf_header_returns_header_value():
     assert token == "header_token_value"
 
 
-def test_verify_csrf_header_returns_none_when_missing():
+def test_verify_csrf_header_returns_none_when_missing(mock_request):
     """Test CSRF header extraction returns None when header absent."""
-    mock_request = MagicMock(spec=Request)
-    mock_request.headers = {}
-
     token = csrf.verify_csrf_header(mock_request)
 
     assert token is None
 
 
-def test_validate_csrf_succeeds_with_matching_tokens():
+def test_validate_csrf_succeeds_with_matching_tokens(mock_request):
     """Test CSRF validation succeeds when cookie and token match."""
-    mock_request = MagicMock(spec=Request)
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: "matching_token"}
-    mock_request.headers = {}
 
     # Should not raise
     result = csrf.validate_csrf(mock_request, token="matching_token")
@@ -116,9 +116,8 @@ def test_validate_csrf_succeeds_with_matching_tokens():
     assert result is True
 
 
-def test_validate_csrf_succeeds_with_header_token():
+def test_validate_csrf_succeeds_with_header_token(mock_request):
     """Test CSRF validation succeeds with X-CSRF-Token header."""
-    mock_request = MagicMock(spec=Request)
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: "matching_token"}
     mock_request.headers = {"X-CSRF-Token": "matching_token"}
 
@@ -128,12 +127,8 @@ def test_validate_csrf_succeeds_with_header_token():
     assert result is True
 
 
-def test_validate_csrf_raises_when_cookie_missing():
+def test_validate_csrf_raises_when_cookie_missing(mock_request):
     """Test CSRF validation fails when cookie is missing."""
-    mock_request = MagicMock(spec=Request)
-    mock_request.cookies = {}
-    mock_request.headers = {}
-
     with pytest.raises(HTTPException) as exc_info:
         csrf.validate_csrf(mock_request, token="some_token")
 
@@ -141,11 +136,9 @@ def test_validate_csrf_raises_when_cookie_missing():
     assert "Invalid CSRF token" in str(exc_info.value.detail)
 
 
-def test_validate_csrf_raises_when_token_missing():
+def test_validate_csrf_raises_when_token_missing(mock_request):
     """Test CSRF validation fails when both token and header are missing."""
-    mock_request = MagicMock(spec=Request)
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: "cookie_token"}
-    mock_request.headers = {}
 
     with pytest.raises(HTTPException) as exc_info:
         csrf.validate_csrf(mock_request, token=None)
@@ -154,11 +147,9 @@ def test_validate_csrf_raises_when_token_missing():
     assert "Invalid CSRF token" in str(exc_info.value.detail)
 
 
-def test_validate_csrf_raises_when_tokens_mismatch():
+def test_validate_csrf_raises_when_tokens_mismatch(mock_request):
     """Test CSRF validation fails when cookie and token don't match."""
-    mock_request = MagicMock(spec=Request)
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: "cookie_token"}
-    mock_request.headers = {}
 
     with pytest.raises(HTTPException) as exc_info:
         csrf.validate_csrf(mock_request, token="different_token")
@@ -167,14 +158,12 @@ def test_validate_csrf_raises_when_tokens_mismatch():
     assert "Invalid CSRF token" in str(exc_info.value.detail)
 
 
-def test_validate_csrf_uses_constant_time_comparison():
+def test_validate_csrf_uses_constant_time_comparison(mock_request):
     """Test CSRF validation uses hmac.compare_digest for timing attack resistance."""
     # This test verifies the function uses hmac.compare_digest internally
     # by testing that it properly validates matching tokens
-    mock_request = MagicMock(spec=Request)
     token_value = "secure_token_12345678"
     mock_request.cookies = {csrf.CSRF_COOKIE_NAME: token_value}
-    mock_request.headers = {}
 
     # Should succeed with exact match
     assert csrf.validate_csrf(mock_request, token=token_value) is True
@@ -2,100 +2,72 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+import pytest
 from fastapi.testclient import TestClient
-
-from fitness.main import app
-
-
-def test_401_page_returns_custom_template_for_html_request(client: TestClient):
-    """Test that 401 errors return custom LCARS-styled template for HTML requests."""
-
-    # Add a test route that raises 401
-    @app.get("/test-401-html")
-    async def test_401_html():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Test 401 error",
-        )
-
-    response = client.get("/test-401-html", headers={"Accept": "text/html"})
-    assert response.status_code == 401
+from httpx import Response
+
+# 401 and 403 both render 401.html; each case is one request checked for
+# every expected fragment.
+AUTH_ERROR_PAGE_CASES = [
+    (
+        401,
+        [
+            # LCARS-specific content
+            b"401",
+            b"AUTHORIZATION REQUIRED",
+            # Navigation links
+            b'href="/"',
+            b'href="/certs"',
+            b'href="/resume"',
+            b'href="/contact"',
+        ],
+    ),
+    (403, [b"401", b"AUTHORIZATION REQUIRED"]),
+]
+
+
+@pytest.fixture(scope="module")
+def html_auth_errors(client: TestClient, raise_route: str) -> dict[int, Response]:
+    """Render each HTML auth error page once for the whole module."""
+    return {
+        code: client.get(f"{raise_route}/{code}", headers={"Accept": "text/html"})
+        for code, _ in AUTH_ERROR_PAGE_CASES
+    }
+
+
+@pytest.mark.parametrize(
+    "code,expected_substrings",
+    AUTH_ERROR_PAGE_CASES,
+    ids=[str(code) for code, _ in AUTH_ERROR_PAGE_CASES],
+)
+def test_auth_error_page_renders_lcars_template(
+    html_auth_errors: dict[int, Response],
+    lcars_base_tokens: tuple[bytes, ...],
+    code: int,
+    expected_substrings: list[bytes],
+):
+    """Test that 401/403 errors render the LCARS 401 template for HTML requests."""
+    response = html_auth_errors[code]
+    assert response.status_code == code
     assert "text/html" in response.headers["content-type"]
-    # Check for LCARS-specific content
-    assert "401" in response.text
-    assert "AUTHORIZATION REQUIRED" in response.text
+    body = response.content
+    missing = [t for t in (*lcars_base_tokens, *expected_substrings) if t not in body]
+    assert not missing
 
 
-def test_401_page_returns_json_for_api_request(client: TestClient):
+def test_401_page_returns_json_for_api_request(client: TestClient, raise_route: str):
     """Test that 401 errors return JSON for API requests."""
-
-    @app.get("/test-401-json")
-    async def test_401_json():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized access"
-        )
-
-    response = client.get("/test-401-json", headers={"Accept": "application/json"})
+    response = client.get(
+        f"{raise_route}/401",
+        params={"detail": "Unauthorized access"},
+        headers={"Accept": "application/json"},
+    )
     assert response.status_code == 401
     assert "application/json" in response.headers["content-type"]
     data = response.json()
     assert "detail" in data
 
 
-def test_401_page_includes_navigation_links(client: TestClient):
-    """Test that 401 page includes helpful navigation links."""
-
-    @app.get("/test-401-navigation")
-    async def test_401_nav():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authorized"
-        )
-
-    response = client.get("/test-401-navigation", headers={"Accept": "text/html"})
-    assert response.status_code == 401
-    # Check for navigation links
-    assert 'href="/"' in response.text  # Home link
-    assert 'href="/certs"' in response.text  # Certifications link
-    assert 'href="/resume"' in response.text  # Resume link
-    assert 'href="/contact"' in response.text  # Contact link
-
-
-def test_401_page_has_lcars_styling(client: TestClient):
-    """Test that 401 page has LCARS theming."""
-
-    @app.get("/test-401-styling")
-    async def test_401_style():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Auth required"
-        )
-
-    response = client.get("/test-401-styling", headers={"Accept": "text/html"})
-    assert response.status_code == 401
-    # Check for LCARS-specific CSS classes and styling
-    assert "error-code" in response.text
-    assert "error-message" in response.text
-    assert "lcars-divider" in response.text
-    assert "--lcars-" in response.text  # CSS variables
-
-
-def test_403_also_uses_401_template(client: TestClient):
-    """Test that 403 Forbidden also uses the 401 template."""
-
-    @app.get("/test-403-forbidden")
-    async def test_403():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden resource"
-        )
-
-    response = client.get("/test-403-forbidden", headers={"Accept": "text/html"})
-    assert response.status_code == 403
-    assert "text/html" in response.headers["content-type"]
-    # Should use same 401 template
-    assert "401" in response.text  # Template shows 401 code
-    assert "AUTHORIZATION REQUIRED" in response.text
-
-
 def test_status_page_redirects_without_auth(client: TestClient):
     """Test that /admin/status/ redirects to login when accessed without auth."""
     response = client.get(
@@ -2,49 +2,60 @@
 
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 
-def test_404_page_returns_custom_template_for_html_request(client: TestClient):
+@pytest.fixture(scope="module")
+def html_404(client: TestClient) -> Response:
+    """Render the HTML 404 page once for every test in this module."""
+    return client.get("/nonexistent-page", headers={"Accept": "text/html"})
+
+
+@pytest.fixture(scope="module")
+def json_404(client: TestClient) -> Response:
+    """Fetch the JSON 404 body once for every test in this module."""
+    return client.get(
+        "/nonexistent-api-endpoint", headers={"Accept": "application/json"}
+    )
+
+
+def test_404_page_returns_custom_template_for_html_request(html_404: Response):
     """Test that 404 errors return custom LCARS-styled template for HTML requests."""
-    response = client.get("/nonexistent-page", headers={"Accept": "text/html"})
-    assert response.status_code == 404
-    assert "text/html" in response.headers["content-type"]
+    assert html_404.status_code == 404
+    assert "text/html" in html_404.headers["content-type"]
     # Check for LCARS-specific content
-    assert "404" in response.text
-    assert "RESOURCE NOT FOUND" in response.text
-    assert "ship's database" in response.text.lower()
+    assert b"404" in html_404.content
+    assert b"RESOURCE NOT FOUND" in html_404.content
+    assert b"ship's database" in html_404.content.lower()
 
 
-def test_404_page_returns_json_for_api_request(client: TestClient):
+def test_404_page_returns_json_for_api_request(json_404: Response):
     """Test that 404 errors return JSON for API requests."""
-    response = client.get(
-        "/nonexistent-api-endpoint", headers={"Accept": "application/json"}
-    )
-    assert response.status_code == 404
-    assert "application/json" in response.headers["content-type"]
-    data = response.json()
+    assert json_404.status_code == 404
+    assert "application/json" in json_404.headers["content-type"]
+    data = json_404.json()
     assert "detail" in data
 
 
-def test_404_page_includes_navigation_links(client: TestClient):
+def test_404_page_includes_navigation_links(html_404: Response):
     """Test that 404 page includes helpful navigation links."""
-    response = client.get("/does-not-exist", headers={"Accept": "text/html"})
-    assert response.status_code == 404
+    assert html_404.status_code == 404
     # Check for navigation links
-    assert 'href="/"' in response.text  # Home link
-    assert 'href="/certs"' in response.text  # Certifications link
-    assert 'href="/resume"' in response.text  # Resume link
-    assert 'href="/admin/status"' in response.text  # Status link
-    assert 'href="/contact"' in response.text  # Contact link
+    assert b'href="/"' in html_404.content  # Home link
+    assert b'href="/certs"' in html_404.content  # Certifications link
+    assert b'href="/resume"' in html_404.content  # Resume link
+    assert b'href="/admin/status"' in html_404.content  # Status link
+    assert b'href="/contact"' in html_404.content  # Contact link
 
 
-def test_404_page_has_lcars_styling(client: TestClient):
+def test_404_page_has_lcars_styling(
+    html_404: Response, lcars_base_tokens: tuple[bytes, ...]
+):
     """Test that 404 page has LCARS theming."""
-    response = client.get("/missing", headers={"Accept": "text/html"})
-    assert response.status_code == 404
+    assert html_404.status_code == 404
     # Check for LCARS-specific CSS classes and styling
-    assert "error-code" in response.text
-    assert "error-message" in response.text
-    assert "lcars-divider" in response.text
-    assert "--lcars-" in response.text  # CSS variables
+    body = html_404.content
+    missing = [token for token in lcars_base_tokens if token not in body]
+    assert not missing
@@ -2,54 +2,62 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+import pytest
+from fastapi import status
 from fastapi.testclient import TestClient
-
-from fitness.main import app
-
-
-def test_503_template_has_lcars_styling(client: TestClient):
-    """Test that 503.html template has proper LCARS styling and content."""
-
-    # Add a test route that raises 503
-    @app.get("/test-503-error-styling")
-    async def test_503_styling():
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Test 503 error",
-        )
-
-    response = client.get("/test-503-error-styling", headers={"Accept": "text/html"})
-
-    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
-    assert "text/html" in response.headers["content-type"]
-
-    # Check for LCARS-specific content
-    assert "503" in response.text
-    assert "SERVICE UNAVAILABLE" in response.text
-    assert "systems are currently offline" in response.text.lower()
-
-    # Check for LCARS styling elements
-    assert "error-code" in response.text
-    assert "error-message" in response.text
-    assert "status-indicator" in response.text  # Blinking status light
-    assert "lcars-divider" in response.text
-    assert "--lcars-" in response.text  # CSS variables
-    assert "lcars-amber" in response.text
-    assert "lcars-red" in response.text  # 503 uses red for urgency
-
-
-def test_503_returns_json_for_api_request(client: TestClient):
+from httpx import Response
+
+# Fragments the HTML 503 page must contain beyond the shared LCARS markup.
+SERVICE_UNAVAILABLE_FRAGMENTS = [
+    # LCARS-specific content
+    b"503",
+    b"SERVICE UNAVAILABLE",
+    b"systems are currently offline",
+    # LCARS styling elements
+    b"status-indicator",  # Blinking status light
+    b"lcars-amber",
+    b"lcars-red",  # 503 uses red for urgency
+    # Recovery actions
+    b"Retry Current Request",
+    b'href="/"',
+    b'href="/admin/status"',
+    b'href="/contact"',
+]
+
+
+@pytest.fixture(scope="module")
+def html_503(client: TestClient, raise_route: str) -> Response:
+    """Render the HTML 503 page once for every test in this module."""
+    return client.get(f"{raise_route}/503", headers={"Accept": "text/html"})
+
+
+@pytest.fixture(scope="module")
+def error_pages(
+    client: TestClient, raise_route: str, html_503: Response
+) -> dict[int, bytes]:
+    """HTML bodies of the 503 and 404 pages, for comparing their styling."""
+    html_404 = client.get(f"{raise_route}/404", headers={"Accept": "text/html"})
+    return {503: html_503.content, 404: html_404.content}
+
+
+def test_503_page_renders_lcars_template(
+    html_503: Response, lcars_base_tokens: tuple[bytes, ...]
+):
+    """Test that 503.html has LCARS styling, content and recovery actions."""
+    assert html_503.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "text/html" in html_503.headers["content-type"]
+    body = html_503.content
+    expected = (*lcars_base_tokens, *SERVICE_UNAVAILABLE_FRAGMENTS)
+    missing = [fragment for fragment in expected if fragment not in body]
+    assert not missing
+
+
+def test_503_returns_json_for_api_request(client: TestClient, raise_route: str):
     """Test that 503 errors return JSON for API requests."""
-
-    @app.get("/test-503-json-response")
-    async def test_503_json():
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Service down"
-        )
-
     response = client.get(
-        "/test-503-json-response", headers={"Accept": "application/json"}
+        f"{raise_route}/503",
+        params={"detail": "Service down"},
+        headers={"Accept": "application/json"},
     )
 
     assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -59,48 +67,13 @@ def test_503_returns_json_for_api_request(client: TestClient):
     assert data["detail"] == "Service down"
 
 
-def test_503_template_includes_recovery_actions(client: TestClient):
-    """Test that 503 page includes helpful recovery actions."""
-
-    @app.get("/test-503-recovery-actions")
-    async def test_503_recovery():
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Service unavailable",
-        )
-
-    response = client.get("/test-503-recovery-actions", headers={"Accept": "text/html"})
-
-    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
-
-    # Check for recovery action links
-    assert "Retry Current Request" in response.text
-    assert 'href="/"' in response.text  # Home link
-    assert 'href="/admin/status"' in response.text  # Status dashboard link
-    assert 'href="/contact"' in response.text  # Contact/support link
-
-
-def test_503_template_differs_from_404_styling(client: TestClient):
+def test_503_template_differs_from_404_styling(error_pages: dict[int, bytes]):
     """Test that 503 page uses different color scheme from 404."""
-
-    @app.get("/test-503-vs-404-1")
-    async def test_503_compare():
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Down"
-        )
-
-    @app.get("/test-503-vs-404-2")
-    async def test_404_compare():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-
-    response_503 = client.get("/test-503-vs-404-1", headers={"Accept": "text/html"})
-    response_404 = client.get("/test-503-vs-404-2", headers={"Accept": "text/html"})
-
     # 503 uses amber/red color scheme
-    assert "lcars-amber" in response_503.text
-    assert "lcars-red" in response_503.text
-    assert "status-indicator" in response_503.text  # Blinking indicator
+    assert b"lcars-amber" in error_pages[503]
+    assert b"lcars-red" in error_pages[503]
+    assert b"status-indicator" in error_pages[503]  # Blinking indicator
 
     # 404 uses peach/amber color scheme (different from 503)
-    assert "lcars-peach" in response_404.text
-    assert "status-indicator" not in response_404.text  # 404 doesn't have this
+    assert b"lcars-peach" in error_pages[404]
+    assert b"status-indicator" not in error_pages[404]  # 404 doesn't have this
@@ -3,26 +3,44 @@
 from __future__ import annotations
 
 from io import BytesIO
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
 from fitness.auth import current_active_user
-from fitness.main import app
 from fitness.models.certification import Certification
 
 CSRF_TOKEN = "test-csrf-token"
+_FAKE_SHA_A = "a" * 64
+_FAKE_SHA_B = "b" * 64
 
 
-@pytest.fixture
-def auth_client(client):
-    """Authenticated test client with CSRF token."""
+@pytest.fixture(scope="session")
+def fake_pdf_bytes() -> bytes:
+    """Minimal PDF payload for upload tests."""
+    return b"%PDF-1.4 fake content"
+
+
+@pytest.fixture(scope="class")
+def _admin_user_override(app):
+    """Authenticate every request for the duration of one test class."""
     mock_user = MagicMock(email="test@test.com", id=uuid4(), is_active=True)
     app.dependency_overrides[current_active_user] = lambda: mock_user
+    yield
+    app.dependency_overrides.pop(current_active_user, None)
+
+
+@pytest.fixture
+def auth_client(client, _admin_user_override):
+    """Authenticated test client with CSRF token.
+
+    The cookie jar is emptied before each test, so only the CSRF cookie is
+    set per test; the auth override is installed once per class.
+    """
     client.cookies.set("wtf_csrf", CSRF_TOKEN)
     yield client
-    app.dependency_overrides.pop(current_active_user, None)
     client.cookies.delete("wtf_csrf")
 
 
@@ -33,7 +51,7 @@ def _seed_cert(db_session, **overrides) -> Certification:
         title="Test Cert",
         issuer="TestOrg",
         pdf_url="/static/certs/test-cert.pdf",
-        sha256="a" * 64,
+        sha256=_FAKE_SHA_A,
         status="active",
         is_visible=True,
         is_active=True,
@@ -41,8 +59,7 @@ def _seed_cert(db_session, **overrides) -> Certification:
     defaults.update(overrides)
     cert = Certification(**defaults)
     db_session.add(cert)
-    db_session.commit()
-    db_session.refresh(cert)
+    db_session.flush()
     return cert
 
 
@@ -75,7 +92,7 @@ class TestCertStatusChange:
         )
         assert resp.status_code == 200
         assert resp.headers.get("HX-Refresh") == "true"
-        db_session.refresh(cert)
+        db_session.expire(cert, ["status", "is_active"])
         assert cert.status == "deprecated"
         assert cert.is_active is False
 
@@ -107,7 +124,7 @@ class TestCertVisibilityToggle:
         )
         assert resp.status_code == 200
         assert resp.headers.get("HX-Refresh") == "true"
-        db_session.refresh(cert)
+        db_session.expire(cert, ["is_visible"])
         assert cert.is_visible is False
 
     def test_visibility_toggle_cert_not_found(self, auth_client):
@@ -121,12 +138,23 @@ class TestCertVisibilityToggle:
 # ── Delete tests ─────────────────────────────────────────────────
 
 
+class _NoFilePath(Path):
+    """Path whose files never exist, so delete_cert leaves the disk alone."""
+
+    def exists(self, *, follow_symlinks: bool = True) -> bool:
+        return False
+
+
 class TestCertDelete:
+    @pytest.fixture(autouse=True)
+    def _no_pdf_on_disk(self, monkeypatch):
+        # Rebind only the admin module's Path; pathlib itself is untouched.
+        monkeypatch.setattr("fitness.routers.admin.Path", _NoFilePath)
+
     def test_delete_removes_cert(self, auth_client, db_session):
         cert = _seed_cert(db_session, slug="delete-me")
         cert_id = cert.id
-        with patch("fitness.routers.admin.Path.exists", return_value=False):
-            resp = auth_client.delete(f"/admin/certs/{cert_id}")
+        resp = auth_client.delete(f"/admin/certs/{cert_id}")
         assert resp.status_code == 200
         assert db_session.query(Certification).filter_by(id=cert_id).first() is None
 
@@ -151,7 +179,7 @@ class TestCertStatusCycle:
             data={"status": "expired", "csrf_token": CSRF_TOKEN},
         )
         assert resp.status_code == 200
-        db_session.refresh(cert)
+        db_session.expire(cert, ["status", "is_active"])
         assert cert.status == "expired"
         assert cert.is_active is False
 
@@ -161,7 +189,7 @@ class TestCertStatusCycle:
             data={"status": "active", "csrf_token": CSRF_TOKEN},
         )
         assert resp.status_code == 200
-        db_session.refresh(cert)
+        db_session.expire(cert, ["status", "is_active"])
         assert cert.status == "active"
         assert cert.is_active is True
 
@@ -178,7 +206,7 @@ class TestCertVisibilityRoundtrip:
             data={"csrf_token": CSRF_TOKEN},
         )
         assert resp.status_code == 200
-        db_session.refresh(cert)
+        db_session.expire(cert, ["is_visible"])
         assert cert.is_visible is False
 
         # hidden → visible
@@ -187,34 +215,36 @@ class TestCertVisibilityRoundtrip:
             data={"csrf_token": CSRF_TOKEN},
         )
         assert resp.status_code == 200
-        db_session.refresh(cert)
+        db_session.expire(cert, ["is_visible"])
         assert cert.is_visible is True
 
 
 class TestCertAdd:
-    def test_add_cert(self, auth_client, db_session):
-        pdf_content = b"%PDF-1.4 fake content"
-        with (
-            patch(
-                "fitness.routers.admin.LocalStorage.save",
-                return_value="/static/certs/new-cert.pdf",
-            ),
-            patch("fitness.routers.admin.hash_file", return_value="b" * 64),
-        ):
-            resp = auth_client.post(
-                "/admin/certs",
-                data={
-                    "slug": "new-cert",
-                    "title": "New Cert",
-                    "issuer": "NewOrg",
-                    "verification_url": "",
-                    "assertion_url": "",
-                    "csrf_token": CSRF_TOKEN,
-                },
-                files={
-                    "file": ("new-cert.pdf", BytesIO(pdf_content), "application/pdf")
-                },
-            )
+    @pytest.fixture(autouse=True)
+    def _stub_storage(self, monkeypatch):
+        async def _save(*_args, **_kwargs):
+            return "/static/certs/new-cert.pdf"
+
+        monkeypatch.setattr("fitness.routers.admin.LocalStorage.save", _save)
+        monkeypatch.setattr(
+            "fitness.routers.admin.hash_file", lambda *a, **k: _FAKE_SHA_B
+        )
+
+    def test_add_cert(self, auth_client, db_session, fake_pdf_bytes):
+        resp = auth_client.post(
+            "/admin/certs",
+            data={
+                "slug": "new-cert",
+                "title": "New Cert",
+                "issuer": "NewOrg",
+                "verification_url": "",
+                "assertion_url": "",
+                "csrf_token": CSRF_TOKEN,
+            },
+            files={
+                "file": ("new-cert.pdf", BytesIO(fake_pdf_bytes), "application/pdf")
+            },
+        )
         assert resp.status_code == 200
         cert = db_session.query(Certification).filter_by(slug="new-cert").first()
         assert cert is not None
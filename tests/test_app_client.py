@@ -1,11 +1,4 @@
-from fastapi.testclient import TestClient
-
-from fitness.main import app
-
-client = TestClient(app)
-
-
-def test_root_endpoint_message():
+def test_root_endpoint_message(client):
     """
     Basic TestClient usage aligned with the FastAPI testing tutorial.
     """
@@ -16,19 +9,19 @@ def test_root_endpoint_message():
     assert payload["docs"] == "/docs"
 
 
-def test_reports_index_page_renders_operations_by_default() -> None:
+def test_reports_index_page_renders_operations_by_default(client) -> None:
     response = client.get("/reports/")
     assert response.status_code == 200
     assert "Operations Reports" in response.text
 
 
-def test_reports_security_section_renders_when_requested() -> None:
+def test_reports_security_section_renders_when_requested(client) -> None:
     response = client.get("/reports/?section=security")
     assert response.status_code == 200
     assert "Security Reports" in response.text
 
 
-def test_legacy_operations_route_redirects_to_index() -> None:
+def test_legacy_operations_route_redirects_to_index(client) -> None:
     response = client.get("/reports/operations", follow_redirects=False)
     assert response.status_code == 307
     assert response.headers["location"].startswith("/reports/")
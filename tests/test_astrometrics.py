@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
@@ -60,6 +59,76 @@ SAMPLE_NEO_DATA = {
     },
 }
 
+EMPTY_NEO_DATA: dict = {"near_earth_objects": {}}
+
+_APOD_RESPONSE = {
+    "title": "Test APOD",
+    "url": "https://apod.nasa.gov/test.jpg",
+    "media_type": "image",
+    "explanation": "A test image.",
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _disable_data_store():
+    """Keep get_briefing off the DynamoDB path for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("fitness.services.astrometrics.settings.use_data_store", False)
+        yield
+
+
+class _MemoryCachePath:
+    """In-memory stand-in for ``CACHE_PATH`` covering the calls the service makes."""
+
+    def __init__(self) -> None:
+        self._data: bytes | None = None
+
+    @property
+    def parent(self) -> _MemoryCachePath:
+        # _write_cache only calls parent.mkdir(); there is no directory to make.
+        return self
+
+    def mkdir(self, *args, **kwargs) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def read_bytes(self) -> bytes:
+        if self._data is None:
+            raise FileNotFoundError("astrometrics-cache.json")
+        return self._data
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
+
+    def write_bytes(self, data: bytes) -> int:
+        self._data = data
+        return len(data)
+
+    def write_text(self, data: str, encoding: str = "utf-8") -> int:
+        return self.write_bytes(data.encode(encoding))
+
+
+@pytest.fixture
+def cache_file(monkeypatch) -> _MemoryCachePath:
+    """Point the service's CACHE_PATH at an empty in-memory cache."""
+    path = _MemoryCachePath()
+    monkeypatch.setattr("fitness.services.astrometrics.CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def svc() -> AstrometricsService:
+    """One service for the session; it holds no per-instance state."""
+    return AstrometricsService()
+
+
+@pytest.fixture(scope="session")
+def parsed_neos(svc) -> list[NeoObject]:
+    """NeoObjects parsed from SAMPLE_NEO_DATA once; treat as read-only."""
+    return svc._parse_neo_objects(SAMPLE_NEO_DATA)
+
 
 # ── NeoObject model ─────────────────────────────────────────────
 
@@ -126,26 +195,35 @@ class TestAstrometricsService:
 
     # ── Parsing ──────────────────────────────────────────────
 
-    def test_parse_closest_neo(self):
-        svc = AstrometricsService()
-        count, closest = svc._parse_closest_neo(SAMPLE_NEO_DATA)
-        assert count == 2
-        # (2024 CD2) is closer at 200,000 km
-        assert "(2024 CD2)" in closest
-        assert "200,000" in closest
-
-    def test_parse_closest_neo_empty(self):
-        svc = AstrometricsService()
-        count, closest = svc._parse_closest_neo({"near_earth_objects": {}})
-        assert count == 0
-        assert closest == "None detected"
-
-    def test_parse_neo_objects(self):
-        svc = AstrometricsService()
-        objects = svc._parse_neo_objects(SAMPLE_NEO_DATA)
-        assert len(objects) == 2
-
-        ab1 = next(o for o in objects if "AB1" in o.name)
+    @pytest.mark.parametrize(
+        "data,expected_count,expected_subs",
+        [
+            # (2024 CD2) is closer at 200,000 km
+            (SAMPLE_NEO_DATA, 2, ["(2024 CD2)", "200,000"]),
+            (EMPTY_NEO_DATA, 0, ["None detected"]),
+        ],
+        ids=["sample", "empty"],
+    )
+    def test_parse_closest_neo(self, svc, data, expected_count, expected_subs):
+        count, closest = svc._parse_closest_neo(data)
+        assert count == expected_count
+        for sub in expected_subs:
+            assert sub in closest
+
+    @pytest.mark.parametrize(
+        "data,expected_names",
+        [
+            (SAMPLE_NEO_DATA, {"(2024 AB1)", "(2024 CD2)"}),
+            (EMPTY_NEO_DATA, set()),
+        ],
+        ids=["sample", "empty"],
+    )
+    def test_parse_neo_objects(self, svc, data, expected_names):
+        objects = svc._parse_neo_objects(data)
+        assert {o.name for o in objects} == expected_names
+
+    def test_parse_neo_objects_fields(self, parsed_neos):
+        ab1 = next(o for o in parsed_neos if "AB1" in o.name)
         assert ab1.estimated_diameter_km_min == 0.1
         assert ab1.estimated_diameter_km_max == 0.2
         assert ab1.is_potentially_hazardous is False
@@ -155,228 +233,125 @@ class TestAstrometricsService:
         assert ab1.close_approach_epoch == 1740268800000
         assert ab1.absolute_magnitude == 25.5
 
-        cd2 = next(o for o in objects if "CD2" in o.name)
+        cd2 = next(o for o in parsed_neos if "CD2" in o.name)
         assert cd2.is_potentially_hazardous is True
         assert cd2.miss_distance_km == 200000.0
 
-    def test_parse_neo_objects_empty(self):
-        svc = AstrometricsService()
-        objects = svc._parse_neo_objects({"near_earth_objects": {}})
-        assert objects == []
-
     # ── Cache ────────────────────────────────────────────────
 
-    def test_read_cache_no_file(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.CACHE_PATH",
-            tmp_path / "nonexistent.json",
-        )
-        svc = AstrometricsService()
+    def test_read_cache_no_file(self, svc, cache_file):
         assert svc._read_cache() is None
 
-    def test_read_cache_expired(self, tmp_path, monkeypatch):
-        cache_file = tmp_path / "astrometrics-cache.json"
-        monkeypatch.setattr("fitness.services.astrometrics.CACHE_PATH", cache_file)
+    def test_read_cache_expired(self, svc, cache_file):
         old_time = (datetime.now(UTC) - timedelta(hours=25)).isoformat()
         briefing = AstrometricsBriefing(apod_title="Old", generated_at=old_time)
-        cache_file.write_text(briefing.model_dump_json(indent=2), encoding="utf-8")
+        cache_file.write_text(briefing.model_dump_json(), encoding="utf-8")
 
-        svc = AstrometricsService()
         assert svc._read_cache() is None
 
-    def test_read_cache_valid(self, tmp_path, monkeypatch):
-        cache_file = tmp_path / "astrometrics-cache.json"
-        monkeypatch.setattr("fitness.services.astrometrics.CACHE_PATH", cache_file)
+    def test_read_cache_valid(self, svc, cache_file):
         fresh_time = datetime.now(UTC).isoformat()
         briefing = AstrometricsBriefing(
             apod_title="Fresh APOD", generated_at=fresh_time
         )
-        cache_file.write_text(briefing.model_dump_json(indent=2), encoding="utf-8")
+        cache_file.write_text(briefing.model_dump_json(), encoding="utf-8")
 
-        svc = AstrometricsService()
         result = svc._read_cache()
         assert result is not None
         assert isinstance(result, AstrometricsBriefing)
         assert result.apod_title == "Fresh APOD"
 
-    def test_write_cache(self, tmp_path, monkeypatch):
-        cache_file = tmp_path / "astrometrics-cache.json"
-        monkeypatch.setattr("fitness.services.astrometrics.CACHE_PATH", cache_file)
+    def test_write_cache(self, svc, cache_file):
         briefing = AstrometricsBriefing(
             apod_title="Cached",
             generated_at=datetime.now(UTC).isoformat(),
         )
-        svc = AstrometricsService()
         svc._write_cache(briefing)
 
         assert cache_file.exists()
-        data = json.loads(cache_file.read_text(encoding="utf-8"))
-        assert data["apod_title"] == "Cached"
+        cached = AstrometricsBriefing.model_validate_json(cache_file.read_bytes())
+        assert cached == briefing
 
     # ── get_briefing ─────────────────────────────────────────
 
     @pytest.mark.asyncio
-    async def test_get_briefing_cached(self, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.settings.use_data_store", False
-        )
-        cached_briefing = AstrometricsBriefing(
-            apod_title="From Cache",
-            generated_at=datetime.now(UTC).isoformat(),
-        )
-        svc = AstrometricsService()
-
-        with (
-            patch.object(
-                svc, "_read_cache", return_value=cached_briefing
-            ) as mock_cache,
-            patch.object(svc, "_fetch_apod") as mock_apod,
-            patch.object(svc, "_fetch_neo") as mock_neo,
-        ):
-            result = await svc.get_briefing()
-
-        mock_cache.assert_called_once()
-        mock_apod.assert_not_called()
-        mock_neo.assert_not_called()
-        assert result.apod_title == "From Cache"
-
-    @pytest.mark.asyncio
-    async def test_get_briefing_api_fallback(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.settings.use_data_store", False
-        )
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.CACHE_PATH",
-            tmp_path / "no-cache.json",
-        )
-        apod_response = {
-            "title": "Test APOD",
-            "url": "https://apod.nasa.gov/test.jpg",
-            "media_type": "image",
-            "explanation": "A test image.",
-        }
-        svc = AstrometricsService()
-
-        with (
-            patch.object(
-                svc, "_fetch_apod", new_callable=AsyncMock, return_value=apod_response
-            ) as mock_apod,
-            patch.object(
-                svc, "_fetch_neo", new_callable=AsyncMock, return_value=SAMPLE_NEO_DATA
-            ) as mock_neo,
-        ):
-            result = await svc.get_briefing()
-
-        mock_apod.assert_awaited_once()
-        mock_neo.assert_awaited_once()
-        assert result.apod_title == "Test APOD"
-        assert result.neo_count == 2
-        assert "(2024 CD2)" in result.neo_closest
-        assert len(result.neo_objects) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_briefing_apod_failure(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.settings.use_data_store", False
-        )
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.CACHE_PATH",
-            tmp_path / "no-cache.json",
-        )
-        svc = AstrometricsService()
-
-        with (
-            patch.object(
-                svc,
-                "_fetch_apod",
-                new_callable=AsyncMock,
-                side_effect=Exception("APOD down"),
+    @pytest.mark.parametrize(
+        "apod,neo,cached_title,force_refresh,expected",
+        [
+            pytest.param(
+                {},
+                {},
+                "From Cache",
+                False,
+                {"apod_title": "From Cache"},
+                id="cached",
             ),
-            patch.object(
-                svc, "_fetch_neo", new_callable=AsyncMock, return_value=SAMPLE_NEO_DATA
+            pytest.param(
+                {"return_value": _APOD_RESPONSE},
+                {"return_value": SAMPLE_NEO_DATA},
+                None,
+                False,
+                {
+                    "apod_title": "Test APOD",
+                    "neo_count": 2,
+                    "neo_closest": "(2024 CD2) (200,000 km)",
+                },
+                id="api-fallback",
             ),
-        ):
-            result = await svc.get_briefing()
-
-        # APOD should fall back gracefully
-        assert result.apod_title == "Unavailable"
-        assert result.apod_url == ""
-        # NEO data should still be populated
-        assert result.neo_count == 2
-        assert len(result.neo_objects) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_briefing_neo_failure(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.settings.use_data_store", False
-        )
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.CACHE_PATH",
-            tmp_path / "no-cache.json",
-        )
-        apod_response = {
-            "title": "Working APOD",
-            "url": "https://apod.nasa.gov/ok.jpg",
-            "media_type": "image",
-            "explanation": "This one works.",
-        }
-        svc = AstrometricsService()
-
-        with (
-            patch.object(
-                svc, "_fetch_apod", new_callable=AsyncMock, return_value=apod_response
+            pytest.param(
+                {"side_effect": Exception("APOD down")},
+                {"return_value": SAMPLE_NEO_DATA},
+                None,
+                False,
+                # APOD falls back gracefully; NEO data is still populated
+                {"apod_title": "Unavailable", "apod_url": "", "neo_count": 2},
+                id="apod-failure",
             ),
-            patch.object(
-                svc,
-                "_fetch_neo",
-                new_callable=AsyncMock,
-                side_effect=Exception("NEO down"),
+            pytest.param(
+                {"return_value": _APOD_RESPONSE},
+                {"side_effect": Exception("NEO down")},
+                None,
+                False,
+                # APOD still works; NEO falls back gracefully
+                {
+                    "apod_title": "Test APOD",
+                    "neo_count": 0,
+                    "neo_closest": "Data unavailable",
+                },
+                id="neo-failure",
             ),
-        ):
-            result = await svc.get_briefing()
-
-        # APOD should still work
-        assert result.apod_title == "Working APOD"
-        # NEO should fall back gracefully
-        assert result.neo_count == 0
-        assert result.neo_closest == "Data unavailable"
-        assert result.neo_objects == []
-
-    @pytest.mark.asyncio
-    async def test_get_briefing_force_refresh(self, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.settings.use_data_store", False
-        )
-        monkeypatch.setattr(
-            "fitness.services.astrometrics.CACHE_PATH",
-            tmp_path / "cache.json",
-        )
-        # Write a valid cache that would normally be returned
-        cache_file = tmp_path / "cache.json"
-        cached = AstrometricsBriefing(
-            apod_title="Stale Cached",
-            generated_at=datetime.now(UTC).isoformat(),
-        )
-        cache_file.write_text(cached.model_dump_json(indent=2), encoding="utf-8")
-
-        apod_response = {
-            "title": "Fresh From API",
-            "url": "https://apod.nasa.gov/fresh.jpg",
-            "media_type": "image",
-            "explanation": "Fresh data.",
-        }
-        svc = AstrometricsService()
+            pytest.param(
+                {"return_value": _APOD_RESPONSE},
+                {"return_value": SAMPLE_NEO_DATA},
+                "Stale Cached",
+                True,
+                # A valid cache is skipped; fresh API data is used
+                {"apod_title": "Test APOD", "neo_count": 2},
+                id="force-refresh",
+            ),
+        ],
+    )
+    async def test_get_briefing(
+        self, svc, cache_file, apod, neo, cached_title, force_refresh, expected
+    ):
+        if cached_title is not None:
+            cached = AstrometricsBriefing(
+                apod_title=cached_title,
+                generated_at=datetime.now(UTC).isoformat(),
+            )
+            cache_file.write_text(cached.model_dump_json(), encoding="utf-8")
+        from_cache = cached_title is not None and not force_refresh
 
         with (
             patch.object(
-                svc, "_fetch_apod", new_callable=AsyncMock, return_value=apod_response
-            ),
-            patch.object(
-                svc, "_fetch_neo", new_callable=AsyncMock, return_value=SAMPLE_NEO_DATA
-            ),
+                svc, "_fetch_apod", new_callable=AsyncMock, **apod
+            ) as mock_apod,
+            patch.object(svc, "_fetch_neo", new_callable=AsyncMock, **neo) as mock_neo,
         ):
-            result = await svc.get_briefing(force_refresh=True)
+            result = await svc.get_briefing(force_refresh=force_refresh)
 
-        # Cache should be skipped; fresh API data used
-        assert result.apod_title == "Fresh From API"
-        assert result.neo_count == 2
+        assert mock_apod.await_count == (0 if from_cache else 1)
+        assert mock_neo.await_count == (0 if from_cache else 1)
+        for field, value in expected.items():
+            assert getattr(result, field) == value
+        assert len(result.neo_objects) == result.neo_count
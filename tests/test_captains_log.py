@@ -5,24 +5,29 @@ from __future__ import annotations
 import re
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi.testclient import TestClient
 
-from fitness.main import app
 from fitness.services.captains_log import CaptainsLogService, compute_stardate
 
+_STARDATE_RE = re.compile(r"^\d{6}\.\d$")
+
 # ── Stardate ────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def stardate() -> str:
+    """One reading of the clock shared by the format and range checks."""
+    return compute_stardate()
+
+
 class TestComputeStardate:
-    def test_format(self):
+    def test_format(self, stardate):
         """Stardate should be a float-like string with one decimal."""
-        sd = compute_stardate()
-        assert re.match(r"^\d{6}\.\d$", sd), f"Bad stardate format: {sd}"
+        assert _STARDATE_RE.match(stardate), f"Bad stardate format: {stardate}"
 
-    def test_range(self):
+    def test_range(self, stardate):
         """Stardate should be in the 101xxx-103xxx range for 2024-2026."""
-        sd = float(compute_stardate())
-        assert 101000.0 <= sd <= 104000.0
+        assert 101000.0 <= float(stardate) <= 104000.0
 
 
 # ── Service unit tests ──────────────────────────────────────────
@@ -35,10 +40,8 @@ class TestCaptainsLogService:
         svc = CaptainsLogService()
         telemetry = await svc.collect_telemetry(db_session)
 
-        assert "stardate" in telemetry
-        assert "cert_count" in telemetry
-        assert "log_entry_count" in telemetry
-        assert "cve_summary" in telemetry
+        expected_keys = {"stardate", "cert_count", "log_entry_count", "cve_summary"}
+        assert expected_keys <= telemetry.keys(), expected_keys - telemetry.keys()
         assert telemetry["cert_count"] >= 0
 
 
@@ -46,18 +49,11 @@ class TestCaptainsLogService:
 
 
 class TestCaptainsLogRoutes:
-    @pytest.mark.asyncio
-    async def test_dashboard_requires_auth(self):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get("/admin/log", follow_redirects=False)
-        assert response.status_code in [302, 401]
-
-    @pytest.mark.asyncio
-    async def test_entry_requires_auth(self):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get(
-                "/admin/log/entry/test-slug", follow_redirects=False
-            )
+    @pytest.mark.parametrize(
+        "method,url",
+        [("GET", "/admin/log"), ("GET", "/admin/log/entry/test-slug")],
+        ids=["dashboard", "entry"],
+    )
+    def test_requires_auth(self, client: TestClient, method: str, url: str):
+        response = client.request(method, url, follow_redirects=False)
         assert response.status_code in [302, 401]
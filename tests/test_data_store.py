@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
 from fitness.services.data_store import DataStoreService
 
@@ -10,13 +13,14 @@ from fitness.services.data_store import DataStoreService
 class TestDataStoreService:
     """Unit tests for DataStoreService."""
 
-    def _make_service(self) -> DataStoreService:
+    @pytest.fixture
+    def svc(self) -> DataStoreService:
         svc = DataStoreService()
-        svc._table = MagicMock()
+        # Only the two table methods the service calls need to be mocks.
+        svc._table = SimpleNamespace(query=Mock(), get_item=Mock())
         return svc
 
-    def test_get_latest_returns_items(self):
-        svc = self._make_service()
+    def test_get_latest_returns_items(self, svc):
         svc._table.query.return_value = {
             "Items": [
                 {
@@ -31,28 +35,24 @@ class TestDataStoreService:
         assert items[0]["payload"]["title"] == "Test"
         svc._table.query.assert_called_once()
 
-    def test_get_latest_returns_empty_on_error(self):
-        svc = self._make_service()
+    def test_get_latest_returns_empty_on_error(self, svc):
         svc._table.query.side_effect = Exception("Connection error")
         items = svc.get_latest("NASA_APOD")
         assert items == []
 
-    def test_query_by_type_with_time_range(self):
-        svc = self._make_service()
+    def test_query_by_type_with_time_range(self, svc):
         svc._table.query.return_value = {"Items": [{"data_type": "cve"}]}
         items = svc.query_by_type("cve", start="2026-01-01", end="2026-02-10")
         assert len(items) == 1
         call_kwargs = svc._table.query.call_args[1]
         assert call_kwargs["IndexName"] == "GSI1-DataType-Timestamp"
 
-    def test_query_by_type_without_range(self):
-        svc = self._make_service()
+    def test_query_by_type_without_range(self, svc):
         svc._table.query.return_value = {"Items": []}
         items = svc.query_by_type("apod")
         assert items == []
 
-    def test_get_item_returns_item(self):
-        svc = self._make_service()
+    def test_get_item_returns_item(self, svc):
         svc._table.get_item.return_value = {
             "Item": {
                 "source": "NIST_CVE",
@@ -63,14 +63,12 @@ class TestDataStoreService:
         assert item is not None
         assert item["source"] == "NIST_CVE"
 
-    def test_get_item_returns_none_on_miss(self):
-        svc = self._make_service()
+    def test_get_item_returns_none_on_miss(self, svc):
         svc._table.get_item.return_value = {}
         item = svc.get_item("MISSING", "key")
         assert item is None
 
-    def test_get_item_returns_none_on_error(self):
-        svc = self._make_service()
+    def test_get_item_returns_none_on_error(self, svc):
         svc._table.get_item.side_effect = Exception("Timeout")
         item = svc.get_item("NASA_APOD", "key")
         assert item is None
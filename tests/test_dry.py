@@ -1,25 +1,42 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib.util
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = PROJECT_ROOT / "tools"
-CHECK_DRY_PATH = SCRIPTS_DIR / "check-dry.py"
+CHECK_DRY_PATH = SCRIPTS_DIR / "check_dry.py"
+# pytest cache key holding the fingerprint of the last tree that scanned clean.
+DRY_CACHE_KEY = "dry/clean-fingerprint"
 
 
+@functools.cache
 def _load_check_dry_module():
-    if str(SCRIPTS_DIR) not in sys.path:
-        sys.path.insert(0, str(SCRIPTS_DIR))
+    # check_dry imports ``tools.utils``, so the project root must be importable.
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
     spec = importlib.util.spec_from_file_location("check_dry", CHECK_DRY_PATH)
     if spec is None or spec.loader is None:
-        raise RuntimeError("Unable to load tools/check-dry.py")
+        raise RuntimeError("Unable to load tools/check_dry.py")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     return module
 
 
+def _tree_fingerprint(files: list[Path]) -> str:
+    """Hash every file's path, mtime and size; any edit changes the result."""
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
 def _format_duplicate(block1, block2, similarity: float) -> str:
     return (
         f"{block1.file_path}:{block1.start_line}-{block1.end_line} "
@@ -28,19 +45,28 @@ def _format_duplicate(block1, block2, similarity: float) -> str:
     )
 
 
-def test_python_functions_do_not_duplicate():
+@pytest.mark.slow
+def test_python_functions_do_not_duplicate(request: pytest.FixtureRequest):
     """
     Mirror the previous pre-commit check-dry hook so duplicates fail during pytest runs.
-    """
-    import pytest
 
-    # Skip this test until check-dry.py script is implemented
+    The O(n^2) comparison is skipped when no file under fitness/, the
+    detector script, or this test has changed since the last clean run.
+    """
+    # Skip this test until check_dry.py script is implemented
     if not CHECK_DRY_PATH.exists():
-        pytest.skip(f"check-dry.py script not found at {CHECK_DRY_PATH}")
+        pytest.skip(f"check_dry.py script not found at {CHECK_DRY_PATH}")
 
     target_root = PROJECT_ROOT / "fitness"
     module = _load_check_dry_module()
     python_files = module.find_python_files(target_root)
+    cache = getattr(request.config, "cache", None)
+    # The detector script and this file (which sets its thresholds) are
+    # inputs too; editing either must force a rescan.
+    fingerprint = _tree_fingerprint([*python_files, CHECK_DRY_PATH, Path(__file__)])
+    if cache is not None and cache.get(DRY_CACHE_KEY, None) == fingerprint:
+        pytest.skip("unchanged since last clean DRY scan")
+
     detector = module.DuplicationDetector(min_lines=6, similarity_threshold=0.8)
     detector.find_duplicates(python_files, use_functions=True)
 
@@ -51,3 +77,5 @@ def test_python_functions_do_not_duplicate():
     assert not duplicate_descriptions, "Duplicate functions found:\n" + "\n".join(
         duplicate_descriptions
     )
+    if cache is not None:
+        cache.set(DRY_CACHE_KEY, fingerprint)
@@ -1,6 +1,10 @@
 """Integration tests covering certificates, résumé, and contact flows."""
 
 import json
+import mmap
+import re
+from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -10,40 +14,32 @@ from sqlalchemy.orm import Session
 from fitness.config import settings
 from fitness.models.certification import Certification
 
-
-def _get_csrf_token(client: TestClient) -> str:
-    """Fetch the contact page to obtain a fresh CSRF token."""
-    response = client.get("/contact")
-    assert response.status_code == 200
-    token = client.cookies.get("wtf_csrf")
-    assert isinstance(token, str), "Expected CSRF cookie after GET /contact"
-    return token
-
-
-def test_certifications_page_deduplicates_entries(
-    client: TestClient, db_session: Session
-) -> None:
+RESUME_DATA_PATH = Path("fitness/data/resume-data.yaml")
+_PDF_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+
+@pytest.fixture
+def duplicate_certs(db_session: Session) -> list[Certification]:
+    """Two visible certifications sharing one SHA; rolled back with db_session."""
+    certs = [
+        Certification(
+            slug=f"dup-{name.lower()}",
+            title=f"Duplicate {name}",
+            issuer="DRY Issuer",
+            pdf_url=f"http://example.com/{name.lower()}.pdf",
+            sha256="abc123",
+            dns_name=f"dup-{name.lower()}.princetonstrong.com",
+        )
+        for name in ("One", "Two")
+    ]
+    db_session.add_all(certs)
+    db_session.flush()
+    return certs
+
+
+@pytest.mark.usefixtures("duplicate_certs")
+def test_certifications_page_deduplicates_entries(client: TestClient) -> None:
     """Ensure duplicate SHA entries collapse to a single certificate."""
-    duplicate_sha = "abc123"
-    first = Certification(
-        slug="dup-one",
-        title="Duplicate One",
-        issuer="DRY Issuer",
-        pdf_url="http://example.com/one.pdf",
-        sha256=duplicate_sha,
-        dns_name="dup-one.princetonstrong.com",
-    )
-    second = Certification(
-        slug="dup-two",
-        title="Duplicate Two",
-        issuer="DRY Issuer",
-        pdf_url="http://example.com/two.pdf",
-        sha256=duplicate_sha,
-        dns_name="dup-two.princetonstrong.com",
-    )
-    db_session.add_all([first, second])
-    db_session.commit()
-
     response = client.get("/certs")
 
     assert response.status_code == 200
@@ -52,30 +48,33 @@ def test_certifications_page_deduplicates_entries(
     assert "/certs/dup-two/pdf" in body
     assert "Duplicate One" not in body
 
-    db_session.query(Certification).filter(
-        Certification.slug.in_(["dup-one", "dup-two"])
-    ).delete(synchronize_session=False)
-    db_session.commit()
 
+@pytest.fixture(scope="session")
+def resume_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Render the résumé PDF once per session into a fresh temp directory."""
+    import fitness.services.pdf_resume as pdf_resume
 
-def test_resume_pdf_endpoint_streams_file(
-    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify the résumé PDF endpoint streams the document."""
-    from fitness.services.pdf_resume import build_resume, load_data
-
-    data_path = Path("fitness/data/resume-data.yaml")
-    if not data_path.exists():
+    if not RESUME_DATA_PATH.exists():
         pytest.skip("resume-data.yaml not found")
 
-    data = load_data(data_path)
-    pdf_path = tmp_path / "PAS-Resume.pdf"
-    build_resume(pdf_path, data, "#7B7B7B", "#FFFFFF")
+    pdf_path = tmp_path_factory.mktemp("resume") / "PAS-Resume.pdf"
+    pdf_resume.build_resume(
+        pdf_path, pdf_resume.load_data(RESUME_DATA_PATH), "#7B7B7B", "#FFFFFF"
+    )
+    return pdf_path
+
 
-    import fitness.routers.ui as ui_mod
+@pytest.fixture(scope="module")
+def resume_storage_dir(resume_pdf: Path) -> Iterator[Path]:
+    """Point /resume/pdf at the session's rendered PDF once for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("fitness.routers.ui.RESUME_STORAGE_DIR", resume_pdf.parent)
+        yield resume_pdf.parent
 
-    monkeypatch.setattr(ui_mod, "RESUME_STORAGE_DIR", tmp_path)
 
+@pytest.mark.usefixtures("resume_storage_dir")
+def test_resume_pdf_endpoint_streams_file(client: TestClient) -> None:
+    """Verify the résumé PDF endpoint streams the document."""
     response = client.get("/resume/pdf")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/pdf"
@@ -83,33 +82,26 @@ def test_resume_pdf_endpoint_streams_file(
     assert len(response.content) > 1000
 
 
-def test_resume_pdf_fits_two_pages(tmp_path: Path) -> None:
+def test_resume_pdf_fits_two_pages(resume_pdf: Path) -> None:
     """Resume PDF must not exceed two pages."""
-    import re
-
-    from fitness.services.pdf_resume import build_resume, load_data
-
-    data_path = Path("fitness/data/resume-data.yaml")
-    if not data_path.exists():
-        pytest.skip("resume-data.yaml not found")
-
-    data = load_data(data_path)
-    out = tmp_path / "resume.pdf"
-    build_resume(out, data, "#7B7B7B", "#FFFFFF")
-
-    content = out.read_bytes().decode("latin-1")
-    counts = re.findall(r"/Count\s+(\d+)", content)
+    with (
+        resume_pdf.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        counts = _PDF_COUNT_RE.findall(mm)
     pages = max(int(c) for c in counts) if counts else 0
     assert pages <= 2, f"Resume is {pages} pages, must be <= 2"
 
 
-@pytest.mark.usefixtures("client")
 def test_contact_form_submission_writes_log(
-    monkeypatch: pytest.MonkeyPatch, client: TestClient, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch,
+    client: TestClient,
+    csrf_token: str,
+    tmp_path: Path,
 ) -> None:
     """Make sure contact submissions persist to disk and return success."""
     monkeypatch.setattr(settings, "data_dir", str(tmp_path))
-    csrf_token = _get_csrf_token(client)
+    client.cookies.set("wtf_csrf", csrf_token)
     payload = {
         "name": "Worf",
         "email": "worf@example.com",
@@ -124,8 +116,9 @@ def test_contact_form_submission_writes_log(
 
     log_path = Path(tmp_path) / "contact-messages.jsonl"
     assert log_path.exists()
-    content = log_path.read_text().strip().splitlines()
-    last = json.loads(content[-1])
+    with log_path.open(encoding="utf-8") as log:
+        (last_line,) = deque(log, maxlen=1)
+    last = json.loads(last_line)
     assert last["name"] == payload["name"]
     assert last["email"] == payload["email"]
     assert last["message"] == payload["message"]
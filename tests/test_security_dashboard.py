@@ -6,13 +6,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.responses import HTMLResponse
-from httpx import ASGITransport, AsyncClient
+from fastapi.testclient import TestClient
 
-from fitness.main import app
 
-
-@pytest.mark.asyncio
-async def test_security_dashboard_is_public():
+def test_security_dashboard_is_public(client: TestClient):
     """Tactical dashboard is publicly accessible (no auth)."""
     with patch("fitness.routers.security_dashboard.aggregator") as mock_agg:
         mock_agg.get_stats = AsyncMock(
@@ -24,41 +21,30 @@ async def test_security_dashboard_is_public():
                 low_count=0,
             )
         )
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get("/tactical/dashboard", follow_redirects=False)
+        response = client.get("/tactical/dashboard", follow_redirects=False)
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_get_advisories_is_public():
+def test_get_advisories_is_public(client: TestClient):
     """Advisories endpoint is publicly accessible."""
     with patch("fitness.routers.security_dashboard.aggregator") as mock_agg:
         mock_agg.fetch_all_advisories = AsyncMock(return_value=[])
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get(
-                "/tactical/advisories?days=7", follow_redirects=False
-            )
+        response = client.get("/tactical/advisories?days=7", follow_redirects=False)
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_get_advisories_with_filters_is_public():
+def test_get_advisories_with_filters_is_public(client: TestClient):
     """Advisories endpoint with filters is publicly accessible."""
     with patch("fitness.routers.security_dashboard.aggregator") as mock_agg:
         mock_agg.fetch_all_advisories = AsyncMock(return_value=[])
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get(
-                "/tactical/advisories?days=30&severity=CRITICAL&source=NIST",
-                follow_redirects=False,
-            )
+        response = client.get(
+            "/tactical/advisories?days=30&severity=CRITICAL&source=NIST",
+            follow_redirects=False,
+        )
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_get_stats_is_public():
+def test_get_stats_is_public(client: TestClient):
     """Stats endpoint is publicly accessible."""
     with patch("fitness.routers.security_dashboard.aggregator") as mock_agg:
         mock_agg.get_stats = AsyncMock(
@@ -71,9 +57,7 @@ async def test_get_stats_is_public():
                 latest_critical=None,
             )
         )
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get("/tactical/stats?days=30", follow_redirects=False)
+        response = client.get("/tactical/stats?days=30", follow_redirects=False)
     assert response.status_code == 200
 
 
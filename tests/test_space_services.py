@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from fitness.services.celestrak import CelesTrakService, SatelliteTLE
@@ -11,6 +12,14 @@ from fitness.services.exoplanet import Exoplanet, ExoplanetService
 from fitness.services.mars_rover import MarsRoverPhoto, MarsRoverService
 from fitness.services.noaa_space_weather import SpaceWeatherReport, SpaceWeatherService
 
+
+def _json_response(payload) -> httpx.Response:
+    """Real 200 response; raise_for_status() needs the request attached."""
+    return httpx.Response(
+        200, json=payload, request=httpx.Request("GET", "https://api.test/")
+    )
+
+
 # ── CelesTrak ────────────────────────────────────────────────────
 
 
@@ -25,16 +34,16 @@ class TestCelesTrakService:
     @pytest.mark.asyncio
     async def test_api_fallback(self):
         svc = CelesTrakService()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = [
-            {
-                "NORAD_CAT_ID": 25544,
-                "OBJECT_NAME": "ISS (ZARYA)",
-                "INCLINATION": 51.6,
-                "ECCENTRICITY": 0.0001,
-            },
-        ]
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _json_response(
+            [
+                {
+                    "NORAD_CAT_ID": 25544,
+                    "OBJECT_NAME": "ISS (ZARYA)",
+                    "INCLINATION": 51.6,
+                    "ECCENTRICITY": 0.0001,
+                },
+            ]
+        )
 
         with patch("fitness.services.celestrak.settings") as mock_settings:
             mock_settings.use_data_store = False
@@ -93,16 +102,16 @@ class TestExoplanetService:
     @pytest.mark.asyncio
     async def test_api_fetch(self):
         svc = ExoplanetService()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = [
-            {
-                "pl_name": "TOI-700 d",
-                "hostname": "TOI-700",
-                "discoverymethod": "Transit",
-                "disc_year": 2025,
-            },
-        ]
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _json_response(
+            [
+                {
+                    "pl_name": "TOI-700 d",
+                    "hostname": "TOI-700",
+                    "discoverymethod": "Transit",
+                    "disc_year": 2025,
+                },
+            ]
+        )
 
         with patch("fitness.services.exoplanet.settings") as mock_settings:
             mock_settings.use_data_store = False
@@ -135,20 +144,20 @@ class TestMarsRoverService:
     @pytest.mark.asyncio
     async def test_api_fetch(self):
         svc = MarsRoverService()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "latest_photos": [
-                {
-                    "id": 12345,
-                    "rover": {"name": "Curiosity"},
-                    "camera": {"name": "NAVCAM", "full_name": "Navigation Camera"},
-                    "img_src": "http://mars.nasa.gov/img.jpg",
-                    "earth_date": "2026-02-01",
-                    "sol": 4000,
-                }
-            ]
-        }
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _json_response(
+            {
+                "latest_photos": [
+                    {
+                        "id": 12345,
+                        "rover": {"name": "Curiosity"},
+                        "camera": {"name": "NAVCAM", "full_name": "Navigation Camera"},
+                        "img_src": "http://mars.nasa.gov/img.jpg",
+                        "earth_date": "2026-02-01",
+                        "sol": 4000,
+                    }
+                ]
+            }
+        )
 
         with patch("fitness.services.mars_rover.settings") as mock_settings:
             mock_settings.use_data_store = False
@@ -5,9 +5,8 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from fitness.main import app
 from fitness.services.geolocation import GeoLocation, GeoLocationService
 from fitness.services.sky_service import SkyConditions, SkyService
 
@@ -276,8 +275,6 @@ class TestSkyService:
 
 class TestStargazingRoutes:
     @pytest.mark.asyncio
-    async def test_dashboard_requires_auth(self):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            response = await ac.get("/admin/stargazing", follow_redirects=False)
+    async def test_dashboard_requires_auth(self, async_client: AsyncClient):
+        response = await async_client.get("/admin/stargazing", follow_redirects=False)
         assert response.status_code in [302, 401]
@@ -0,0 +1,78 @@
+"""Tests for CachedStaticFiles lookup memoization in fitness/staticfiles.py."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from fitness.staticfiles import CachedStaticFiles
+
+
+def _static(directory: Path, **kwargs) -> CachedStaticFiles:
+    return CachedStaticFiles(directory=str(directory), **kwargs)
+
+
+class TestCachedStaticFilesLookups:
+    """lookup_path memoization behind the static_lookup_cache setting."""
+
+    def test_off_by_default(self, tmp_path):
+        (tmp_path / "app.css").write_text("body {}")
+        static = _static(tmp_path)
+
+        assert static.lookup_path("app.css")[1] is not None
+        assert not static._lookups
+
+    def test_hit_is_remembered(self, tmp_path):
+        css = tmp_path / "app.css"
+        css.write_text("body {}")
+        static = _static(tmp_path, memoize_lookups=True)
+
+        first = static.lookup_path("app.css")
+        css.unlink()
+
+        assert static.lookup_path("app.css") == first
+
+    def test_miss_is_not_remembered(self, tmp_path):
+        static = _static(tmp_path, memoize_lookups=True)
+
+        assert static.lookup_path("late.css")[1] is None
+        assert not static._lookups
+
+        (tmp_path / "late.css").write_text("body {}")
+        assert static.lookup_path("late.css")[1] is not None
+
+    def test_cache_is_bounded_lru(self, tmp_path):
+        for name in ("a.css", "b.css", "c.css"):
+            (tmp_path / name).write_text(name)
+        static = _static(tmp_path, memoize_lookups=True, lookup_cache_size=2)
+
+        static.lookup_path("a.css")
+        static.lookup_path("b.css")
+        static.lookup_path("a.css")  # a is now the most recently used
+        static.lookup_path("c.css")
+
+        assert list(static._lookups) == ["a.css", "c.css"]
+
+    def test_concurrent_lookups_share_one_bounded_cache(self, tmp_path):
+        names = [f"{i}.css" for i in range(8)]
+        for name in names:
+            (tmp_path / name).write_text(name)
+        static = _static(tmp_path, memoize_lookups=True, lookup_cache_size=4)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(static.lookup_path, names * 50))
+
+        assert all(stat is not None for _, stat in results)
+        assert len(static._lookups) == 4
+
+
+def test_static_mount_serves_and_memoizes(app, client):
+    """The test app opts in via WITNESS_STATIC_CACHE; hits land in its LRU."""
+    static = next(route.app for route in app.routes if route.path == "/static")
+    assert static.memoize_lookups
+
+    for _ in range(2):
+        response = client.get("/static/styles.css")
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+    assert "styles.css" in static._lookups
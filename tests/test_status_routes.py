@@ -19,7 +19,6 @@ from uuid import uuid4
 import pytest
 
 from fitness.auth import current_active_user
-from fitness.main import app
 from fitness.observability.safe_metrics import (
     ObservabilitySnapshot,
     StatusSnapshot,
@@ -34,7 +33,7 @@ CSRF_TOKEN = "test-csrf-token"  # noqa: S105
 
 
 @pytest.fixture
-def auth_client(client):
+def auth_client(app, client):
     """Authenticated test client with CSRF token."""
     mock_user = MagicMock(email="test@test.com", id=uuid4(), is_active=True)
     app.dependency_overrides[current_active_user] = lambda: mock_user
@@ -520,17 +520,9 @@ def test_persist_contact_submission_writes(client: TestClient, tmp_path: Path):
 # ---------------------------------------------------------------------------
 
 
-def _get_csrf_token(client: TestClient) -> str:
-    """Fetch /contact to obtain a CSRF token from the cookie."""
-    client.get("/contact")
-    token = client.cookies.get("wtf_csrf")
-    assert token is not None, "CSRF cookie not set"
-    return token
-
-
-def test_submit_contact_honeypot(client: TestClient):
+def test_submit_contact_honeypot(client: TestClient, csrf_token: str):
     """Filling the honeypot field returns silent 'success' without sending."""
-    csrf = _get_csrf_token(client)
+    client.cookies.set("wtf_csrf", csrf_token)
     resp = client.post(
         "/contact",
         data={
@@ -539,23 +531,19 @@ def test_submit_contact_honeypot(client: TestClient):
             "subject": "Buy pills",
             "message": "Click here",
             "honeypot": "I am a bot",
-            "csrf_token": csrf,
+            "csrf_token": csrf_token,
         },
-        cookies={"wtf_csrf": csrf},
         follow_redirects=False,
     )
     # Honeypot returns a rendered template with success=True (200)
     assert resp.status_code == 200
-    assert (
-        "csrf" in resp.text.lower()
-        or "success" in resp.text.lower()
-        or resp.status_code == 200
-    )
+    body = resp.text.lower()
+    assert "csrf" in body or "success" in body or resp.status_code == 200
 
 
-def test_submit_contact_validation_error(client: TestClient):
+def test_submit_contact_validation_error(client: TestClient, csrf_token: str):
     """Invalid form data (empty name) returns 422 with error message."""
-    csrf = _get_csrf_token(client)
+    client.cookies.set("wtf_csrf", csrf_token)
     resp = client.post(
         "/contact",
         data={
@@ -564,17 +552,16 @@ def test_submit_contact_validation_error(client: TestClient):
             "subject": "Hello",
             "message": "Hi there",
             "honeypot": "",
-            "csrf_token": csrf,
+            "csrf_token": csrf_token,
         },
-        cookies={"wtf_csrf": csrf},
         follow_redirects=False,
     )
     assert resp.status_code == 422
 
 
-def test_submit_contact_invalid_email(client: TestClient):
+def test_submit_contact_invalid_email(client: TestClient, csrf_token: str):
     """Invalid email format triggers Pydantic/FastAPI validation."""
-    csrf = _get_csrf_token(client)
+    client.cookies.set("wtf_csrf", csrf_token)
     resp = client.post(
         "/contact",
         data={
@@ -583,18 +570,17 @@ def test_submit_contact_invalid_email(client: TestClient):
             "subject": "Test",
             "message": "Hello",
             "honeypot": "",
-            "csrf_token": csrf,
+            "csrf_token": csrf_token,
         },
-        cookies={"wtf_csrf": csrf},
         follow_redirects=False,
     )
     # FastAPI's Form(EmailStr) will reject before reaching our handler -> 422
     assert resp.status_code == 422
 
 
-def test_submit_contact_success_redirects(client: TestClient):
+def test_submit_contact_success_redirects(client: TestClient, csrf_token: str):
     """Valid contact submission returns 303 redirect to /contact?success=1."""
-    csrf = _get_csrf_token(client)
+    client.cookies.set("wtf_csrf", csrf_token)
     with (
         patch("fitness.routers.ui._persist_contact_submission"),
         patch("fitness.routers.ui._deliver_contact_message"),
@@ -607,9 +593,8 @@ def test_submit_contact_success_redirects(client: TestClient):
                 "subject": "Engage",
                 "message": "Make it so.",
                 "honeypot": "",
-                "csrf_token": csrf,
+                "csrf_token": csrf_token,
             },
-            cookies={"wtf_csrf": csrf},
             follow_redirects=False,
         )
     assert resp.status_code == 303
@@ -18,6 +18,10 @@ AZURE_SUBSCRIPTION_PATTERN = (
     r"[0-9a-fA-F]{12}"
 )
 
+# Minimum segment lengths keep short base64-ish runs from matching and bound
+# the backtracking between the three dot-separated segments.
+JWT_PATTERN = r"eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}"
+
 
 def run_git_command(cmd: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(  # nosec B603 - fixed command template, no user input
@@ -33,40 +37,45 @@ def _header(message: str) -> None:
     print(f"\n{Colors.YELLOW}{message}{Colors.NC}")
 
 
+SENSITIVE_FILE_PATTERNS = [
+    r"\.env(\.|$)",
+    r"\.pem$",
+    r"\.key$",
+    r"_rsa$",
+    r"\.pfx$",
+    r"\.p12$",
+    r"sp-credentials\.json$",
+    r"credentials\.json$",
+    r"terraform\.tfvars$",
+    r"\.vault_password$",
+    r"kubeconfig$",
+    r"\.kubeconfig$",
+    r"k3s\.yaml$",
+    r"auth\.json$",
+    r"service-account.*\.json$",
+]
+
+# One alternation over raw path bytes: each path is scanned once and only
+# decoded when it is actually flagged.
+_SENSITIVE_FILE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in SENSITIVE_FILE_PATTERNS).encode()
+)
+
+
 def check_sensitive_files() -> bool:
     _header("Checking for sensitive file patterns...")
-    patterns = [
-        r"\.env(\.|$)",
-        r"\.pem$",
-        r"\.key$",
-        r"_rsa$",
-        r"\.pfx$",
-        r"\.p12$",
-        r"sp-credentials\.json$",
-        r"credentials\.json$",
-        r"terraform\.tfvars$",
-        r"\.vault_password$",
-        r"kubeconfig$",
-        r"\.kubeconfig$",
-        r"k3s\.yaml$",
-        r"auth\.json$",
-        r"service-account.*\.json$",
-    ]
-
-    staged = subprocess.run(  # nosec B607,B603 - fixed git invocation
-        ["git", "ls-files"],
+    tracked = subprocess.run(  # nosec B607,B603 - fixed git invocation
+        ["git", "ls-files", "-z"],
         capture_output=True,
-        text=True,
         check=False,
-    ).stdout.splitlines()
+    ).stdout
 
     flagged = False
-    for file_name in staged:
-        for pattern in patterns:
-            if re.search(pattern, file_name):
-                print_colored(f"✗ Sensitive file tracked: {file_name}", Colors.RED)
-                flagged = True
-                break
+    for file_name in tracked.split(b"\0"):
+        if file_name and _SENSITIVE_FILE_RE.search(file_name):
+            name = file_name.decode("utf-8", "replace")
+            print_colored(f"✗ Sensitive file tracked: {name}", Colors.RED)
+            flagged = True
 
     if not flagged:
         print_colored("✓ No sensitive files tracked", Colors.GREEN)
@@ -77,7 +86,7 @@ def _grep(pattern: str, excludes: str = "") -> bool:
     cmd = ["git", "grep", "-n", "--color=never", "-E", pattern]
     if excludes:
         # Parse excludes like " -- ':(exclude).git' ':(exclude)*.md'"
-        cmd.extend(["--", ":(exclude).git", ":(exclude)*.md"])
+        cmd.extend(["--", ":(exclude).git", ":(exclude)*.md", ":(exclude)*.min.js"])
     result = run_git_command(cmd)
     if result.returncode == 0 and result.stdout.strip():
         print(result.stdout.strip())
@@ -93,7 +102,7 @@ def check_patterns() -> int:
         ("Private keys", r"-----BEGIN (EC|RSA|DSA|OPENSSH|PRIVATE) KEY-----"),
         ("GitHub tokens", r"ghp_[A-Za-z0-9]{36}"),
         ("Slack tokens", r"xox[baprs]-[0-9a-zA-Z]{10,48}"),
-        ("JWT tokens", r"eyJ[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+"),
+        ("JWT tokens", JWT_PATTERN),
     ]
 
     failures = 0
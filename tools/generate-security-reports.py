@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,15 @@ STAMP = datetime.now()
 STAMP_SUFFIX = STAMP.strftime("%Y%m%d-%H%M%S")
 
 
+@dataclass(slots=True)
+class ReportResult:
+    """A written report plus the counts the summary page needs."""
+
+    path: Path
+    total: int
+    severity_counts: dict[str, int] = field(default_factory=dict)
+
+
 def _load_json_report(file_path: Path) -> Any | None:
     """Load JSON data from a path if it exists and is non-empty."""
     if not file_path.exists() or file_path.stat().st_size == 0:
@@ -40,7 +50,7 @@ def _timestamped_path(directory: Path, stem: str) -> Path:
     return directory / f"{stem}-{STAMP_SUFFIX}.md"
 
 
-def generate_bandit_report(src: Path, dest: Path) -> Path | None:
+def generate_bandit_report(src: Path, dest: Path) -> ReportResult | None:
     """Convert Bandit JSON output into Markdown."""
     data = _load_json_report(src)
     if not data:
@@ -114,10 +124,10 @@ def generate_bandit_report(src: Path, dest: Path) -> Path | None:
             )
 
     _write(dest, "\n".join(content))
-    return dest
+    return ReportResult(dest, total, severity_counts)
 
 
-def generate_semgrep_report(src: Path, dest: Path) -> Path | None:
+def generate_semgrep_report(src: Path, dest: Path) -> ReportResult | None:
     """Convert Semgrep JSON into Markdown."""
     data = _load_json_report(src)
     if not data:
@@ -171,7 +181,7 @@ def generate_semgrep_report(src: Path, dest: Path) -> Path | None:
             )
 
     _write(dest, "\n".join(content))
-    return dest
+    return ReportResult(dest, len(results), severity_counts)
 
 
 def generate_json_table_report(
@@ -181,7 +191,7 @@ def generate_json_table_report(
     key: str,
     columns: list[tuple[str, str]],
     ok_message: str,
-) -> Path | None:
+) -> ReportResult | None:
     """Transform tabular security outputs (Safety, pip-audit, etc.)."""
     data = _load_json_report(src)
     if not data:
@@ -205,16 +215,16 @@ def generate_json_table_report(
         for row in rows:
             content.append(
                 "| "
-                + " | ".join(str(row.get(field, "N/A")) for _, field in columns)
+                + " | ".join(str(row.get(column, "N/A")) for _, column in columns)
                 + " |"
             )
 
     _write(dest, "\n".join(content))
-    return dest
+    return ReportResult(dest, len(rows))
 
 
 def generate_summary_report(
-    reports_dir: Path, generated: dict[str, Path | None]
+    reports_dir: Path, generated: dict[str, ReportResult | None]
 ) -> None:
     """Write the consolidated summary page."""
     entries = [
@@ -233,19 +243,29 @@ def generate_summary_report(
         "",
         "## Scan Status",
         "",
-        "| Category | Tool | Status | Report |",
-        "|----------|------|--------|--------|",
+        "| Category | Tool | Status | Findings | Report |",
+        "|----------|------|--------|----------|--------|",
     ]
 
-    for category, tool, report_path in entries:
-        if report_path and report_path.exists():
-            rel_path = report_path.relative_to(reports_dir).as_posix()
+    # Generators return None when their input was missing, so the result
+    # itself says whether a report was written; no need to stat it again.
+    for category, tool, result in entries:
+        if result:
+            rel_path = result.path.relative_to(reports_dir).as_posix()
             link = f"[View]({rel_path})"
-            exists = True
+            status = "✅"
+            findings = str(result.total)
+            if result.severity_counts:
+                breakdown = ", ".join(
+                    f"{severity.title()} {count}"
+                    for severity, count in result.severity_counts.items()
+                )
+                findings = f"{findings} ({breakdown})"
         else:
             link = "—"
-            exists = False
-        lines.append(f"| {category} | {tool} | {'✅' if exists else '⏭️'} | {link} |")
+            status = "⏭️"
+            findings = "—"
+        lines.append(f"| {category} | {tool} | {status} | {findings} | {link} |")
 
     lines.extend(
         [
@@ -268,7 +288,7 @@ def main() -> None:
     sast_dir = reports_dir / "sast"
     sca_dir = reports_dir / "sca"
 
-    generated: dict[str, Path | None] = {}
+    generated: dict[str, ReportResult | None] = {}
 
     generated["bandit"] = generate_bandit_report(
         sast_dir / "bandit.json", _timestamped_path(sast_dir, "bandit")